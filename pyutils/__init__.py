@@ -0,0 +1,6 @@
+"""
+A collection of utilities for file encryption, Excel data analysis, email sending and SQL charts.
+
+Subpackages are not imported here, so `import pyutils` and the CLI stay fast;
+each CLI subcommand imports only the module (and heavy dependencies) it needs.
+"""
@@ -6,11 +6,15 @@ from email.message import EmailMessage
 from datetime import datetime
 from pathlib import Path
 
+from ..profiling import span
+
 
 # This script generates some test emails and sends them through stage leroymerlin smtp server.
 # To use this script you must have installed python interpreter,
 # provide login and password of smtp server, list of recipients,
-# then just invoke command: `python send_emails_by_STAGE_smtp.py`
+# then just invoke command: `python -m pyutils send stage --login <login> --password <pass> --to <recipient> ...`
+
+ATTACHMENTS_DIR = Path(__file__).parent
 
 
 def create_test_email(n, to, add_attachments=False):
@@ -51,42 +55,38 @@ def create_test_email(n, to, add_attachments=False):
     msg.set_content(html, subtype='html')
 
     if add_attachments:
-        file_path = Path("тестовый файл 1.png")
+        file_path = ATTACHMENTS_DIR / "тестовый файл 1.png"
         with file_path.open("rb") as fp:
             msg.add_attachment(fp.read(), maintype="image", subtype="png", filename=file_path.name)
 
-        file_path = Path("тестовый файл 2.png")
+        file_path = ATTACHMENTS_DIR / "тестовый файл 2.png"
         with file_path.open("rb") as fp:
             msg.add_attachment(fp.read(), maintype="image", subtype="png", filename=file_path.name)
     return msg
 
 
-s = smtplib.SMTP(host='owa.leroymerlin.ru', port=587)
-s.starttls()
-s.ehlo()
-# TODO: change login and password
-s.login('login', 'pass')
-
-# TODO: change recipients
-recipient = 'test@gmail.com'
-s.send_message(create_test_email(1, recipient))
-print(f'{datetime.now()}: Email 1 sent to Gmail.com through stage smtp server')
-time.sleep(0.05)
-
-recipient = 'test@mail.ru'
-s.send_message(create_test_email(2, recipient))
-print(f'{datetime.now()}: Email 2 sent to Mail.ru through stage smtp server')
-time.sleep(0.05)
+def send_stage_emails(recipients, login, password, host='owa.leroymerlin.ru', port=587):
+    """
+    Sends one test email to each recipient through the stage smtp server.
 
-recipient = 'test@yandex.ru'
-s.send_message(create_test_email(3, recipient))
-print(f'{datetime.now()}: Email 3 sent to Yandex Mail through stage smtp server')
-time.sleep(0.05)
+    Args:
+        recipients (list of str): Recipient addresses, e.g. one mailbox per mail provider.
+        login (str): Login of the smtp server.
+        password (str): Password of the smtp server.
+        host (str): Host of the smtp server.
+        port (int): Port of the smtp server.
+    """
+    s = smtplib.SMTP(host=host, port=port)
+    s.starttls()
+    s.ehlo()
+    s.login(login, password)
 
-recipient = 'test@exchange.ru'
-s.send_message(create_test_email(4, recipient))
-print(f'{datetime.now()}: Email 4 sent to MS Exchange through stage smtp server')
-time.sleep(0.05)
+    for n, recipient in enumerate(recipients, start=1):
+        msg = create_test_email(n, recipient)
+        with span('email.send_message', n=n):
+            s.send_message(msg)
+        print(f'{datetime.now()}: Email {n} sent to {recipient} through stage smtp server')
+        time.sleep(0.05)
 
-s.quit()
-print('done')
+    s.quit()
+    print('done')
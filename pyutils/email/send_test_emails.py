@@ -0,0 +1,87 @@
+import random
+import smtplib
+import time
+
+import requests
+from email.message import EmailMessage
+from datetime import datetime
+from pathlib import Path
+
+from ..profiling import span
+
+# This script generates some test emails using standalone greenmail.
+# To use this script you must have installed python interpreter,
+# then just invoke command: `python -m pyutils send test`
+
+ATTACHMENTS_DIR = Path(__file__).parent
+
+
+def create_test_email(n, m=0, add_attachments=False):
+    msg = EmailMessage()
+    cust_req_num = f'ТКЦ-2023-03-02-{str(m).zfill(7)}'
+    msg['Subject'] = f'Test email {n}, #[{cust_req_num}] request number'
+    msg['From'] = f'me.{m}@me.com'
+    msg['To'] = 'test@example.com'
+    msg.set_content(f"{n} - Это тестовое сообщение. Номер обращения: {cust_req_num}")
+
+    if add_attachments:
+        file_path = ATTACHMENTS_DIR / "тестовый файл 1.png"
+        with file_path.open("rb") as fp:
+            msg.add_attachment(fp.read(), maintype="image", subtype="png", filename=file_path.name)
+
+        file_path = ATTACHMENTS_DIR / "тестовый файл 2.png"
+        with file_path.open("rb") as fp:
+            msg.add_attachment(fp.read(), maintype="image", subtype="png", filename=file_path.name)
+    return msg
+
+
+def ensure_test_user(api_url='http://localhost:8080/api/user'):
+    """
+    Creates the test user through the application API unless it already exists.
+
+    To use these requests you need to install python lib 'requests'.
+    """
+    new_user = {
+        'email': 'test@example.com',
+        'login': 'user',
+        'password': 'pass'
+    }
+    users = list(requests.get(api_url).json())
+    if len(users) > 0:
+        user = users[0]
+        if user['email'] != new_user['email'] or user['login'] != new_user['login']:
+            requests.post(api_url, json=new_user)
+    else:
+        requests.post(api_url, json=new_user)
+
+
+def send_test_emails(count=500, host='localhost', port=3025, api_url='http://localhost:8080/api/user'):
+    """
+    Sends test emails to standalone greenmail, about 30% of them with attachments.
+
+    Args:
+        count (int): Number of emails to send.
+        host (str): Host of the greenmail smtp server.
+        port (int): Port of the greenmail smtp server.
+        api_url (str): User API of the application; the test user is created there first.
+    """
+    ensure_test_user(api_url)
+
+    s = smtplib.SMTP(host=host, port=port)
+
+    for i in range(count):
+        random_int = random.randrange(10)
+
+        if random.randrange(100) < 30:
+            msg = create_test_email(i, m=random_int, add_attachments=True)
+        else:
+            msg = create_test_email(i, m=random_int)
+
+        with span('email.send_message', n=i):
+            s.send_message(msg)
+
+        print(f'{datetime.now()}: Email {i} sent')
+        time.sleep(0.05)
+
+    s.quit()
+    print('done')
@@ -1,7 +1,8 @@
-import sys
 from Crypto.Cipher import AES
 from Crypto.Protocol.KDF import PBKDF2
 
+from ..profiling import span
+
 def decrypt_file(in_filename: str, password: str, out_filename: str = None):
     """
     Decrypts a file encrypted using AES-256-GCM and PBKDF2-HMAC-SHA256.
@@ -33,14 +34,16 @@ def decrypt_file(in_filename: str, password: str, out_filename: str = None):
     ciphertext = file_data[44:]
 
     # Derive the same 256-bit key from password and salt
-    key = PBKDF2(password, salt, dkLen=32, count=200_000)
+    with span('decrypt.pbkdf2'):
+        key = PBKDF2(password, salt, dkLen=32, count=200_000)
 
     # Create AES cipher with same nonce
     cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
 
     try:
         # Decrypt and validate tag
-        plaintext = cipher.decrypt_and_verify(ciphertext, tag)
+        with span('decrypt.cipher', size=len(ciphertext)):
+            plaintext = cipher.decrypt_and_verify(ciphertext, tag)
     except ValueError:
         raise ValueError("Decryption failed: wrong password or corrupted file")
 
@@ -50,10 +53,3 @@ def decrypt_file(in_filename: str, password: str, out_filename: str = None):
         f.write(plaintext)
 
     print(f"Decrypted file saved as: {out_filename}")
-
-if __name__ == '__main__':
-    if len(sys.argv) != 3:
-        print("Usage: python decrypt_secure.py <input_file> <password>")
-        sys.exit(1)
-
-    decrypt_file(sys.argv[1], sys.argv[2])
@@ -1,8 +1,9 @@
 import os
-import sys
 from Crypto.Cipher import AES
 from Crypto.Protocol.KDF import PBKDF2
 
+from ..profiling import span
+
 def encrypt_file(in_filename: str, password: str, out_filename: str = None):
     """
     Encrypts a file using AES-256 in GCM mode and PBKDF2-HMAC-SHA256 key derivation.
@@ -28,7 +29,8 @@ def encrypt_file(in_filename: str, password: str, out_filename: str = None):
     nonce = os.urandom(12)
 
     # Derive a 256-bit key (32 bytes) from password using PBKDF2-HMAC-SHA256
-    key = PBKDF2(password, salt, dkLen=32, count=200_000)
+    with span('encrypt.pbkdf2'):
+        key = PBKDF2(password, salt, dkLen=32, count=200_000)
 
     # Create AES-GCM cipher object
     cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
@@ -38,7 +40,8 @@ def encrypt_file(in_filename: str, password: str, out_filename: str = None):
         plaintext = f.read()
 
     # Encrypt and produce authentication tag
-    ciphertext, tag = cipher.encrypt_and_digest(plaintext)
+    with span('encrypt.cipher', size=len(plaintext)):
+        ciphertext, tag = cipher.encrypt_and_digest(plaintext)
 
     # Compose final output file path
     out_filename = out_filename or (in_filename + '.enc')
@@ -48,10 +51,3 @@ def encrypt_file(in_filename: str, password: str, out_filename: str = None):
         f.write(salt + nonce + tag + ciphertext)
 
     print(f"Encrypted file saved as: {out_filename}")
-
-if __name__ == '__main__':
-    if len(sys.argv) != 3:
-        print("Usage: python encrypt_secure.py <input_file> <password>")
-        sys.exit(1)
-
-    encrypt_file(sys.argv[1], sys.argv[2])
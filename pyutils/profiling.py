@@ -0,0 +1,211 @@
+"""
+Profiling and hot-path instrumentation shared by all utilities.
+
+- `span` times a named block and writes one JSON line per call to the sink set by `enable_spans`.
+  While spans are disabled it returns a shared no-op context manager, so instrumented code pays
+  only a function call and a `None` check.
+- `profile_run` wraps a whole run with cProfile and/or tracemalloc and prints the reports to stderr.
+  While memory is traced, every span exit and every `memory_checkpoint` call is a checkpoint; the allocation
+  sites are reported from the checkpoint with the most traced memory, while the workload's data is still alive.
+
+The CLI exposes these as `--spans`, `--profile`, `--profile-output` and `--trace-memory`.
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+# Frames kept per traced allocation, so allocation sites can be grouped by traceback
+TRACE_FRAMES = 10
+
+_NULL_SPAN = nullcontext()
+_sink = None
+_memory_checkpoint = None
+
+
+class _Span:
+    """
+    Times a block and writes it as a JSON line on exit.
+    """
+
+    __slots__ = ('name', 'fields', 'start', 'wall_start')
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self):
+        self.wall_start = time.time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+
+        checkpoint = _memory_checkpoint
+        if checkpoint is not None:
+            checkpoint(self.name)
+
+        sink = _sink
+        if sink is None:
+            return False
+
+        record = {
+            'span': self.name,
+            'start': round(self.wall_start, 6),
+            'duration_ms': round(duration * 1000, 3),
+            'pid': os.getpid()
+        }
+        if exc_type is not None:
+            record['error'] = exc_type.__name__
+        record.update(self.fields)
+
+        sink.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        sink.flush()
+        return False
+
+
+def span(name, **fields):
+    """
+    Returns a context manager timing the enclosed block as span `name`.
+
+    Args:
+        name (str): Span name, e.g. 'encrypt.pbkdf2'.
+        **fields: Extra JSON-serializable values added to the span record (file name, row count, ...).
+
+    Returns:
+        A context manager; a shared no-op one while spans are disabled and memory is not traced.
+    """
+    if _sink is None and _memory_checkpoint is None:
+        return _NULL_SPAN
+    return _Span(name, fields)
+
+
+def enable_spans(stream):
+    """
+    Starts writing span records as JSON lines to `stream` (any object with `write` and `flush`).
+    """
+    global _sink
+    _sink = stream
+
+
+def disable_spans():
+    """
+    Stops writing span records; `span` becomes a no-op again.
+    """
+    global _sink
+    _sink = None
+
+
+def memory_checkpoint(label):
+    """
+    Marks a point where the workload's memory is live, e.g. right after a handler returns its result.
+
+    Does nothing unless `profile_run` traces memory.
+    """
+    checkpoint = _memory_checkpoint
+    if checkpoint is not None:
+        checkpoint(label)
+
+
+class _PeakSnapshot:
+    """
+    Keeps the allocation statistics of the checkpoint with the most traced memory.
+
+    Only the top statistics are kept, not the snapshot, so earlier checkpoints do not inflate later ones.
+    Allocations whose traceback runs through the import system (module-level code of lazily imported
+    dependencies) are summed into `import_size` instead of being ranked with the workload's sites.
+    """
+
+    def __init__(self, top):
+        self.top = top
+        self.size = 0
+        self.import_size = 0
+        self.label = None
+        self.stats = []
+
+    def __call__(self, label):
+        import tracemalloc
+
+        current, _ = tracemalloc.get_traced_memory()
+        if current <= self.size:
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>", all_frames=True)
+        ])
+        stats = snapshot.statistics('traceback')
+
+        self.size = current
+        self.import_size = current - sum(stat.size for stat in stats)
+        self.label = label
+        self.stats = stats[:self.top]
+
+    def print_report(self, peak):
+        print(f"tracemalloc peak: {peak / 2 ** 20:.1f} MiB", file=sys.stderr)
+        if self.label is None:
+            print("No memory checkpoint was reached", file=sys.stderr)
+            return
+
+        print(f"Top {self.top} allocation sites at checkpoint '{self.label}' "
+              f"({self.size / 2 ** 20:.1f} MiB traced, {self.import_size / 2 ** 20:.1f} MiB of it by module imports):",
+              file=sys.stderr)
+        for stat in self.stats:
+            print(f"  {stat.size / 2 ** 10:10.1f} KiB {stat.count:8d} blocks", file=sys.stderr)
+            for frame in reversed(stat.traceback):  # Most recent call first
+                print(f"      {frame.filename}:{frame.lineno}", file=sys.stderr)
+
+
+@contextmanager
+def profile_run(profile=False, profile_output=None, trace_memory=False, top=25):
+    """
+    Profiles the enclosed block with cProfile and/or tracemalloc.
+
+    cProfile, pstats and tracemalloc are imported only when requested.
+
+    Args:
+        profile (bool): Print the top cProfile entries by cumulative time to stderr.
+        profile_output (str, optional): Also save the raw pstats data to this file (readable with `python -m pstats`).
+        trace_memory (bool): Print the tracemalloc peak and the top allocation sites, grouped by traceback,
+            at the checkpoint with the most traced memory to stderr.
+        top (int): Number of entries in each report.
+    """
+    global _memory_checkpoint
+
+    profiler = None
+    if profile or profile_output:
+        import cProfile
+
+        profiler = cProfile.Profile()
+
+    peak_snapshot = None
+    if trace_memory:
+        import tracemalloc
+
+        peak_snapshot = _PeakSnapshot(top)
+        _memory_checkpoint = peak_snapshot
+        tracemalloc.start(TRACE_FRAMES)
+
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+
+        if peak_snapshot is not None:
+            _memory_checkpoint = None
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peak_snapshot.print_report(peak)
+
+        if profiler is not None:
+            import pstats
+
+            if profile_output:
+                profiler.dump_stats(profile_output)
+                print(f"Profile saved as: {profile_output}", file=sys.stderr)
+            if profile:
+                pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(top)
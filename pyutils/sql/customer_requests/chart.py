@@ -0,0 +1,35 @@
+import matplotlib.pyplot as plt
+
+from .db import fetch_rows
+
+QUERY = """
+SELECT DATE_TRUNC('hour', created_at) as "hour", count(1) FROM customer_request
+WHERE created_at between '2024-10-01 00:00:00' and '2024-10-06 23:59:59'
+and owner_group_id = '318b646c-cad6-41b2-824d-8a00522d72e5'
+GROUP BY "hour"
+ORDER BY "hour"
+"""
+
+
+def plot_hourly_requests(url, port=None):
+    """
+    Plots the number of customer requests created per hour for 01.10.2024 - 06.10.2024.
+    """
+    rows = fetch_rows(url, QUERY, port)
+
+    # Dates
+    x = []
+    # Counts
+    y = []
+
+    for row in rows:
+        x.append(row[0])
+        y.append(row[1])
+
+    fig, ax = plt.subplots()
+    ax.plot(x, y)
+    ax.set_xlabel('created_at truncated to hours')
+    ax.set_ylabel('count')
+    ax.set_title('Количество обращений создаваемых за период с 01.10.2024 по 06.10.2024 сгруппированное по часам')
+
+    plt.show()
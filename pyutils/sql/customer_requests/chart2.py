@@ -0,0 +1,36 @@
+import matplotlib.pyplot as plt
+
+from .db import fetch_rows
+
+QUERY = """
+SELECT DATE_TRUNC('day', created_at) as d, count(1) FROM customer_request
+WHERE status = 'IN_PROGRESS' 
+and created_at > '2024-09-01 00:00:00'
+and owner_group_id = '318b646c-cad6-41b2-824d-8a00522d72e5'
+GROUP BY d
+ORDER BY d
+"""
+
+
+def plot_open_requests(url, port=None):
+    """
+    Plots the number of currently open customer requests grouped by creation day.
+    """
+    rows = fetch_rows(url, QUERY, port)
+
+    # Dates
+    x = []
+    # Counts
+    y = []
+
+    for row in rows:
+        x.append(row[0])
+        y.append(row[1])
+
+    fig, ax = plt.subplots()
+    ax.plot(x, y)
+    ax.set_xlabel('created_at truncated to days')
+    ax.set_ylabel('count')
+    ax.set_title('Количество открытых обращений на текущий момент сгруппированное по дням создания')
+
+    plt.show()
@@ -0,0 +1,233 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from contextlib import nullcontext
+
+import matplotlib
+
+matplotlib.use('Agg')  # Render off-screen; must happen before pyplot is imported by the analyzers
+
+import matplotlib.pyplot as plt
+
+from .generate_test_data import generate_headache_data, generate_money_workbook
+from .headache_stats import (
+    aggregate_medication_usage,
+    count_monthly_headaches,
+    plot_headache_counts,
+    plot_medication_trends,
+    read_headache_data
+)
+from .money_manager_stats import aggregate_financial_scenarios, load_financial_data, plot_financial_summary
+
+"""
+This script benchmarks the xls analyzers against synthetic workbooks of growing size.
+
+The script performs the following functions:
+1. Generates headache and money manager workbooks for every scale step (rows per file / sheet).
+2. Measures parse, aggregation and render time and peak traced memory of each stage.
+   Render stages plot precomputed aggregates, so their time does not include aggregation.
+3. Prints a table, optionally writes the results as JSON and compares them with a JSON baseline.
+
+Run it with `python -m pyutils.xls.benchmark`.
+"""
+
+SCENARIOS = {
+    "All": {},
+    "Investment excluded": {
+        "exclude_income_cols": ["Инвестиции"],
+        "exclude_expense_cols": ["Инвестиции"]
+    },
+    "Only Investment": {
+        "include_income_cols": ["Инвестиции"],
+        "include_expense_cols": ["Инвестиции"]
+    }
+}
+
+
+def _render(plot, *args):
+    """
+    Calls a plotting function and draws all figures it created, then closes them.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # plt.show() warns on the non-interactive Agg backend
+        plot(*args)
+    for num in plt.get_fignums():
+        plt.figure(num).canvas.draw()
+    plt.close('all')
+
+
+def _aggregate_headache(aggregated_data):
+    return count_monthly_headaches(aggregated_data), aggregate_medication_usage(aggregated_data)
+
+
+def _render_headache(aggregates):
+    monthly_counts, medication_trends = aggregates
+    _render(plot_headache_counts, *monthly_counts)
+    _render(plot_medication_trends, *medication_trends)
+
+
+def _render_money(scenarios):
+    for monthly_data in scenarios.values():
+        _render(plot_financial_summary, monthly_data)
+
+
+def measure(func, *args, repeat=1, trace_memory=True):
+    """
+    Measures a single benchmark stage.
+
+    Time is the best of `repeat` runs without tracing; peak memory comes from one extra run under tracemalloc,
+    so tracing overhead does not distort the timings.
+
+    Returns:
+        tuple: The stage result, elapsed seconds and peak traced bytes (None if memory tracing is disabled).
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return result, best, peak
+
+
+def run_scale(rows, files, work_dir, repeat=1, trace_memory=True, seed=0):
+    """
+    Generates workbooks for one scale step and benchmarks every stage on them.
+
+    Args:
+        rows (int): Rows per headache file and per money manager sheet.
+        files (int): Number of headache files and of money manager sheets.
+        work_dir (str): Folder for the generated workbooks.
+        repeat (int): Timed runs per stage; the best one is reported.
+        trace_memory (bool): Whether to measure peak memory of each stage.
+        seed (int): Random seed for the generated data.
+
+    Returns:
+        list of dict: One record per stage with 'rows', 'stage', 'seconds' and 'peak_bytes'.
+    """
+    scale_dir = os.path.join(work_dir, str(rows))
+    headache_files = generate_headache_data(os.path.join(scale_dir, "headache"), files, rows, seed=seed)
+    money_file = generate_money_workbook(os.path.join(scale_dir, "money.xlsx"), files, rows, seed=seed)
+
+    records = []
+
+    def stage(name, func, *args):
+        result, seconds, peak = measure(func, *args, repeat=repeat, trace_memory=trace_memory)
+        records.append({"rows": rows, "stage": name, "seconds": seconds, "peak_bytes": peak})
+        return result
+
+    headache_data = stage("headache_parse", read_headache_data, headache_files)
+    headache_aggregates = stage("headache_aggregate", _aggregate_headache, headache_data)
+    stage("headache_render", _render_headache, headache_aggregates)
+
+    money_data = stage("money_parse", load_financial_data, money_file)
+    scenarios = stage("money_aggregate", aggregate_financial_scenarios, money_data, SCENARIOS)
+    stage("money_render", _render_money, scenarios)
+
+    return records
+
+
+def compare_with_baseline(records, baseline, max_ratio=None):
+    """
+    Prints the time and memory ratio of every stage against a baseline produced by this script.
+
+    Args:
+        records (list of dict): Results of the current run.
+        baseline (dict): JSON document written by `--output`.
+        max_ratio (float, optional): Time or memory ratio above which a stage counts as a regression.
+
+    Returns:
+        list of str: '<rows> <stage>' of every stage whose time or memory ratio exceeds `max_ratio`.
+    """
+    base = {(r["rows"], r["stage"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"\n{'rows':>8}  {'stage':<20}{'time x':>10}{'memory x':>10}")
+    for record in records:
+        ref = base.get((record["rows"], record["stage"]))
+        if ref is None:
+            continue
+        time_ratio = record["seconds"] / ref["seconds"] if ref["seconds"] else float("nan")
+        memory_ratio = (
+            record["peak_bytes"] / ref["peak_bytes"]
+            if record["peak_bytes"] is not None and ref.get("peak_bytes") else float("nan")
+        )
+        # NaN ratios (missing or zero baseline values) never compare greater, so they are not flagged
+        regressed = max_ratio is not None and (time_ratio > max_ratio or memory_ratio > max_ratio)
+        if regressed:
+            regressions.append(f"{record['rows']} {record['stage']}")
+        print(f"{record['rows']:>8}  {record['stage']:<20}{time_ratio:>10.2f}{memory_ratio:>10.2f}"
+              f"{'  REGRESSION' if regressed else ''}")
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the xls analyzers on synthetic workbooks.")
+    parser.add_argument("--scales", default="365,3650,36500",
+                        help="comma separated rows per file/sheet for each scale step (default: %(default)s)")
+    parser.add_argument("--files", type=int, default=3,
+                        help="headache files and money manager sheets per step (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per stage (default: %(default)s)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak memory run")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare results with a JSON file written by --output")
+    parser.add_argument("--max-ratio", type=float,
+                        help="with --baseline, exit with 1 if any stage's time or memory ratio exceeds this value")
+    parser.add_argument("--work-dir", help="keep generated workbooks in this folder instead of a temporary one")
+    args = parser.parse_args(argv)
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+    records = []
+
+    # Generated workbooks go to --work-dir if given, otherwise to a temporary folder removed afterwards
+    with nullcontext(args.work_dir) if args.work_dir else tempfile.TemporaryDirectory() as work_dir:
+        print(f"{'rows':>8}  {'stage':<20}{'seconds':>10}{'peak MiB':>10}")
+        for rows in scales:
+            for record in run_scale(rows, args.files, work_dir, args.repeat, not args.no_memory):
+                peak = "-" if record["peak_bytes"] is None else f"{record['peak_bytes'] / 2 ** 20:.1f}"
+                print(f"{record['rows']:>8}  {record['stage']:<20}{record['seconds']:>10.3f}{peak:>10}")
+                records.append(record)
+
+    result = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "files": args.files,
+        "repeat": args.repeat,
+        "results": records
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"Results saved as: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(records, baseline, args.max_ratio)
+        if regressions:
+            print(f"Regressions above {args.max_ratio}x: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+from .generate_test_data import generate_money_workbook
+from .money_manager_stats import aggregate_financial_data, aggregate_financial_scenarios, load_financial_data
+
+"""
+This script checks the vectorized money manager aggregation against the original per-column loop.
+
+The script performs the following functions:
+1. Generates a money manager workbook with empty 'Incomes sum' cells and categories missing from some sheets.
+2. Aggregates it with the original loop implementation and with `aggregate_financial_data` /
+   `aggregate_financial_scenarios`, including an include-only scenario against its explicit exclude list.
+3. Prints the result of every comparison and exits with 1 if any of them differ.
+
+Run it with `python -m pyutils.xls.check_money_scenarios`.
+"""
+
+ONLY_INVESTMENT_EXCLUDED_INCOMES = ["Другое", "ЗП Нелли", "ЗП Руслан"]
+ONLY_INVESTMENT_EXCLUDED_EXPENSES = [
+    "Валюта",
+    "Дети",
+    "Другое",
+    "Ежемесячные",
+    "Ипотека/Недвижимость",
+    "Кредиты и долги",
+    "Образование",
+    "Отдых",
+    "Подарки",
+    "Ремонт (материалы)",
+    "Ремонт (мебель/техн.)",
+    "Ремонт (работа)"
+]
+
+
+def aggregate_with_loops(file_path, exclude_income_cols=None, exclude_expense_cols=None):
+    """
+    Original `aggregate_financial_data`: reads every sheet and subtracts excluded columns one by one.
+
+    Kept unchanged as the reference the vectorized implementation is compared with.
+    """
+    exclude_income_cols = exclude_income_cols or []
+    exclude_expense_cols = exclude_expense_cols or []
+
+    xls = pd.ExcelFile(file_path)
+    all_data = []
+
+    for sheet_name in xls.sheet_names:
+        df = pd.read_excel(xls, sheet_name=sheet_name, header=[0, 1])
+        df = df.iloc[1:]
+
+        df.columns = [' '.join(str(s).strip() for s in col if str(s) != 'nan') for col in df.columns]
+
+        date_col = [col for col in df.columns if 'Date' in col][0]
+        income_sum_col = [col for col in df.columns if 'Incomes sum' in col][0]
+        expense_sum_col = [col for col in df.columns if 'Expenses sum' in col][0]
+        savings_col = [col for col in df.columns if 'Savings' in col][0]
+
+        df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
+        df[income_sum_col] = pd.to_numeric(df[income_sum_col], errors='coerce')
+        df[expense_sum_col] = pd.to_numeric(df[expense_sum_col], errors='coerce')
+        df[savings_col] = pd.to_numeric(df[savings_col], errors='coerce')
+
+        for col in exclude_income_cols:
+            col = f"Incomes {col}"
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+                df[income_sum_col] = df[income_sum_col] - df[col].fillna(0)
+
+        for col in exclude_expense_cols:
+            col = f"Expenses {col}"
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+                df[expense_sum_col] = df[expense_sum_col] - df[col].fillna(0)
+
+        df = df[[date_col, income_sum_col, expense_sum_col, savings_col]].dropna(subset=[date_col])
+        df = df.rename(columns={
+            date_col: 'Date',
+            income_sum_col: 'Income',
+            expense_sum_col: 'Expense',
+            savings_col: 'Savings'
+        })
+
+        all_data.append(df)
+
+    full_data = pd.concat(all_data)
+    full_data = full_data.dropna(subset=['Date'])
+    full_data.set_index('Date', inplace=True)
+
+    return full_data.resample('ME').agg({
+        'Income': 'sum',
+        'Expense': 'sum',
+        'Savings': 'last'
+    })
+
+
+def check_scenarios(file_path):
+    """
+    Compares the loop and vectorized aggregations of a money manager export.
+
+    Args:
+        file_path (str): Path to the Excel file.
+
+    Returns:
+        list of str: Names of the comparisons that differ; empty if all match.
+    """
+    cases = {
+        "All": ([], []),
+        "Investment excluded": (["Инвестиции"], ["Инвестиции"]),
+        "Only Investment": (ONLY_INVESTMENT_EXCLUDED_INCOMES, ONLY_INVESTMENT_EXCLUDED_EXPENSES),
+        "Unknown category excluded": (["Нет такой"], ["Нет такой"])
+    }
+    expected = {name: aggregate_with_loops(file_path, *excludes) for name, excludes in cases.items()}
+
+    actual = {
+        f"aggregate_financial_data: {name}": (name, aggregate_financial_data(file_path, *excludes))
+        for name, excludes in cases.items()
+    }
+
+    scenarios = {
+        name: {'exclude_income_cols': excludes[0], 'exclude_expense_cols': excludes[1]}
+        for name, excludes in cases.items()
+    }
+    scenarios["Only Investment (include)"] = {
+        'include_income_cols': ["Инвестиции"],
+        'include_expense_cols': ["Инвестиции"]
+    }
+    results = aggregate_financial_scenarios(load_financial_data(file_path), scenarios)
+    for name, monthly_data in results.items():
+        reference = "Only Investment" if name == "Only Investment (include)" else name
+        actual[f"aggregate_financial_scenarios: {name}"] = (reference, monthly_data)
+
+    failed = []
+    for label, (reference, monthly_data) in actual.items():
+        try:
+            pd.testing.assert_frame_equal(expected[reference], monthly_data, check_dtype=False)
+        except AssertionError as e:
+            failed.append(label)
+            print(f"FAIL {label}\n{e}")
+        else:
+            print(f"ok   {label}")
+
+    return failed
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        money_file = generate_money_workbook(
+            os.path.join(tmp_dir, "money.xlsx"),
+            sheets=4,
+            rows_per_sheet=200,
+            seed=0,
+            vary_categories=True,
+            missing_total_ratio=0.05
+        )
+        failed = check_scenarios(money_file)
+
+    sys.exit(1 if failed else 0)
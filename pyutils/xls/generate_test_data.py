@@ -0,0 +1,215 @@
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Optional
+
+import openpyxl
+
+"""
+This script generates synthetic Excel workbooks in the layouts expected by the xls analyzers.
+
+The script performs the following functions:
+1. Generates yearly headache workbooks (one sheet per month) for `headache_stats.read_headache_data`.
+2. Generates a money manager export (two-level Incomes/Expenses headers, one sheet per year)
+   for `money_manager_stats.load_financial_data`.
+
+Workbooks are written in openpyxl write-only mode, so large scales do not keep the whole sheet in memory.
+"""
+
+PAIN_DESCRIPTIONS = ["Слабая", "Средняя", "Сильная", "Очень сильная", "Мигрень с аурой"]
+MEDICATIONS = ["Нурофен", "Цитрамон", "Суматриптан", "Пенталгин", "Кеторол", "Золмитриптан", "Парацетамол", "Аспирин"]
+RESULTS = ["Помогло", "Не помогло", "Частично"]
+
+INCOME_CATEGORIES = ["Другое", "Инвестиции", "ЗП Нелли", "ЗП Руслан"]
+EXPENSE_CATEGORIES = [
+    "Валюта",
+    "Дети",
+    "Другое",
+    "Ежемесячные",
+    "Инвестиции",
+    "Ипотека/Недвижимость",
+    "Кредиты и долги",
+    "Образование",
+    "Отдых",
+    "Подарки",
+    "Ремонт (материалы)",
+    "Ремонт (мебель/техн.)",
+    "Ремонт (работа)"
+]
+
+
+def _category_names(base: list[str], count: int) -> list[str]:
+    """
+    Returns `count` category names, reusing `base` first and numbering the rest.
+    """
+    return [base[i] if i < len(base) else f"{base[i % len(base)]} {i // len(base) + 1}" for i in range(count)]
+
+
+def generate_headache_workbook(
+        file_path: str,
+        year: int,
+        rows: int,
+        medications_count: int = 5,
+        seed: Optional[int] = None
+) -> str:
+    """
+    Writes one yearly headache workbook with a sheet per month.
+
+    Each sheet has a header row (date, pain description, medications..., 'Результат') followed by
+    observation rows. A small share of rows uses string dates or is left invalid, as in hand-filled files.
+
+    Args:
+        file_path (str): Output path of the XLSX file.
+        year (int): Year of the observation dates.
+        rows (int): Total number of observation rows spread across the months.
+        medications_count (int): Number of medication columns.
+        seed (int, optional): Random seed for reproducible output.
+
+    Returns:
+        str: The path of the written file.
+    """
+    rng = random.Random(seed)
+    medications = _category_names(MEDICATIONS, medications_count)
+    header = ["Дата", "Описание боли"] + medications + ["Результат"]
+
+    workbook = openpyxl.Workbook(write_only=True)
+    rows_per_month = [rows // 12 + (1 if m < rows % 12 else 0) for m in range(12)]
+
+    for month, month_rows in enumerate(rows_per_month, start=1):
+        sheet = workbook.create_sheet(f"{month:02d}")
+        sheet.append(header)
+
+        start = datetime(year, month, 1)
+        days = ((datetime(year + month // 12, month % 12 + 1, 1)) - start).days
+        for _ in range(month_rows):
+            observation_date = start + timedelta(days=rng.randrange(days))
+            roll = rng.random()
+            if roll < 0.05:
+                date_value = observation_date.strftime("%Y-%m-%d")
+            elif roll < 0.07:
+                date_value = "нет даты"
+            else:
+                date_value = observation_date
+
+            pain_description = rng.choice(PAIN_DESCRIPTIONS) if rng.random() > 0.03 else None
+            doses = [rng.randint(1, 2) if rng.random() < 0.3 else None for _ in medications]
+            sheet.append([date_value, pain_description] + doses + [rng.choice(RESULTS)])
+
+    workbook.save(file_path)
+    return file_path
+
+
+def generate_headache_data(
+        folder_path: str,
+        years: int = 1,
+        rows_per_year: int = 365,
+        medications_count: int = 5,
+        seed: Optional[int] = None
+) -> list[str]:
+    """
+    Writes one headache workbook per year into a folder, like the yearly files `headache_stats` reads.
+
+    Args:
+        folder_path (str): Output folder, created if missing.
+        years (int): Number of yearly files.
+        rows_per_year (int): Number of observation rows per file.
+        medications_count (int): Number of medication columns.
+        seed (int, optional): Random seed for reproducible output.
+
+    Returns:
+        list of str: Paths of the written files.
+    """
+    os.makedirs(folder_path, exist_ok=True)
+    first_year = 2020
+    return [
+        generate_headache_workbook(
+            os.path.join(folder_path, f"{year}.xlsx"),
+            year,
+            rows_per_year,
+            medications_count,
+            None if seed is None else seed + year
+        )
+        for year in range(first_year, first_year + years)
+    ]
+
+
+def generate_money_workbook(
+        file_path: str,
+        sheets: int = 1,
+        rows_per_sheet: int = 365,
+        income_categories: int = len(INCOME_CATEGORIES),
+        expense_categories: int = len(EXPENSE_CATEGORIES),
+        seed: Optional[int] = None,
+        vary_categories: bool = False,
+        missing_total_ratio: float = 0.0
+) -> str:
+    """
+    Writes a money manager export with one sheet per period.
+
+    Each sheet has a two-level header ('Date', 'Incomes' / 'sum' + categories, 'Expenses' / 'sum' + categories,
+    'Savings'), a 'Previous savings' row and one row per day with category amounts and running savings.
+
+    Args:
+        file_path (str): Output path of the XLSX file.
+        sheets (int): Number of sheets, each covering the period right after the previous one.
+        rows_per_sheet (int): Number of daily rows per sheet.
+        income_categories (int): Number of income category columns.
+        expense_categories (int): Number of expense category columns.
+        seed (int, optional): Random seed for reproducible output.
+        vary_categories (bool): Drop a different income and expense category from every sheet after the first,
+            as when categories are added or removed over time.
+        missing_total_ratio (float): Share of rows whose 'Incomes sum' cell is left empty.
+
+    Returns:
+        str: The path of the written file.
+    """
+    rng = random.Random(seed)
+    all_incomes = _category_names(INCOME_CATEGORIES, income_categories)
+    all_expenses = _category_names(EXPENSE_CATEGORIES, expense_categories)
+
+    workbook = openpyxl.Workbook(write_only=True)
+    date = datetime(2020, 1, 1)
+    savings = 100_000.0
+
+    for sheet_index in range(sheets):
+        sheet = workbook.create_sheet(f"{date.year}_{sheet_index + 1}")
+        incomes, expenses = all_incomes, all_expenses
+        if vary_categories and sheet_index > 0:
+            incomes = [c for i, c in enumerate(all_incomes) if i != (sheet_index - 1) % len(all_incomes)]
+            expenses = [c for i, c in enumerate(all_expenses) if i != (sheet_index - 1) % len(all_expenses)]
+        sheet.append(["Date", "Incomes"] + [None] * len(incomes) + ["Expenses"] + [None] * len(expenses) + ["Savings"])
+        sheet.append([None, "sum"] + incomes + ["sum"] + expenses + [None])
+        sheet.append(["Previous savings", None] + [None] * len(incomes) + [None] + [None] * len(expenses) + [savings])
+
+        for _ in range(rows_per_sheet):
+            income_values = [round(rng.uniform(1_000, 100_000), 2) if rng.random() < 0.1 else None for _ in incomes]
+            expense_values = [round(rng.uniform(100, 20_000), 2) if rng.random() < 0.3 else None for _ in expenses]
+            income_sum = sum(v for v in income_values if v)
+            expense_sum = sum(v for v in expense_values if v)
+            savings += income_sum - expense_sum
+            if rng.random() < missing_total_ratio:
+                income_sum = None
+
+            sheet.append(
+                [date, income_sum] + income_values + [expense_sum] + expense_values + [round(savings, 2)]
+            )
+            date += timedelta(days=1)
+
+    workbook.save(file_path)
+    return file_path
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python -m pyutils.xls.generate_test_data <output_folder> [rows_per_year]")
+        sys.exit(1)
+
+    out_folder = sys.argv[1]
+    rows = int(sys.argv[2]) if len(sys.argv) == 3 else 365
+
+    files = generate_headache_data(os.path.join(out_folder, "headache"), years=3, rows_per_year=rows, seed=0)
+    print(f"Headache workbooks saved as: {', '.join(files)}")
+
+    money_file = generate_money_workbook(os.path.join(out_folder, "money.xlsx"), sheets=3, rows_per_sheet=rows, seed=0)
+    print(f"Money manager workbook saved as: {money_file}")
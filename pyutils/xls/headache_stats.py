@@ -5,6 +5,8 @@ from datetime import datetime
 import matplotlib.pyplot as plt
 import openpyxl
 
+from ..profiling import span
+
 """
 This script reads headache data from Excel files and generates various statistics.
 
@@ -12,9 +14,24 @@ The script performs the following functions:
 1. Reads data from multiple Excel files and aggregates it into a list of dictionaries.
 2. Calculates the number of headaches per month.
 3. Plots a number of medications used per month.
+
+Run it with `python -m pyutils headache <folder>`.
 """
 
 
+def list_xlsx_files(folder_path):
+    """
+    Lists the XLSX files in a folder, e.g. the yearly headache files.
+
+    Args:
+        folder_path (str): Folder containing XLSX files.
+
+    Returns:
+        list of str: Sorted paths of the XLSX files.
+    """
+    return sorted(os.path.join(folder_path, f) for f in os.listdir(folder_path) if f.endswith(".xlsx"))
+
+
 def read_headache_data(file_paths):
     """
     Reads headache data from a list of Excel file paths and aggregates it.
@@ -28,46 +45,50 @@ def read_headache_data(file_paths):
     aggregated_data = []
 
     for file_path in file_paths:
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
-
-        for sheet_name in workbook.sheetnames:
-            sheet = workbook[sheet_name]
-
-            for row in sheet.iter_rows(min_row=2, values_only=True):
-                if len(row) < 2:
-                    continue
-
-                # Validate the first column to ensure it's a date
-                observation_date = row[0]
-                if not isinstance(observation_date, datetime):
-                    try:
-                        observation_date = datetime.strptime(str(observation_date), "%Y-%m-%d")
-                    except ValueError:
-                        continue  # Skip row if the first column isn't a valid date
-
-                # Ensure the second column (pain description) is not empty
-                pain_description = row[1]
-                if not pain_description:
-                    continue  # Skip row if pain description is empty
-
-                # Extract other columns (medications)
-                medications = {}
-                for i, value in enumerate(row[2:], start=2):  # Start from the third column
-                    if value:  # Only include non-empty values
-                        medications[sheet.cell(row=1, column=i + 1).value] = value
-
-                # Append to the result list
-                aggregated_data.append((observation_date, pain_description, medications))
+        with span('headache.parse_workbook', file=file_path):
+            workbook = openpyxl.load_workbook(file_path, data_only=True)
+
+            for sheet_name in workbook.sheetnames:
+                sheet = workbook[sheet_name]
+
+                for row in sheet.iter_rows(min_row=2, values_only=True):
+                    if len(row) < 2:
+                        continue
+
+                    # Validate the first column to ensure it's a date
+                    observation_date = row[0]
+                    if not isinstance(observation_date, datetime):
+                        try:
+                            observation_date = datetime.strptime(str(observation_date), "%Y-%m-%d")
+                        except ValueError:
+                            continue  # Skip row if the first column isn't a valid date
+
+                    # Ensure the second column (pain description) is not empty
+                    pain_description = row[1]
+                    if not pain_description:
+                        continue  # Skip row if pain description is empty
+
+                    # Extract other columns (medications)
+                    medications = {}
+                    for i, value in enumerate(row[2:], start=2):  # Start from the third column
+                        if value:  # Only include non-empty values
+                            medications[sheet.cell(row=1, column=i + 1).value] = value
+
+                    # Append to the result list
+                    aggregated_data.append((observation_date, pain_description, medications))
 
     return aggregated_data
 
 
-def plot_monthly_headache_trends(aggregated_data):
+def count_monthly_headaches(aggregated_data):
     """
-    Plots the number of headaches per month based on the aggregated data.
+    Counts the number of headaches per month based on the aggregated data.
 
     Args:
         aggregated_data (list of tuples): Aggregated headache data including observation date and pain description.
+
+    Returns:
+        tuple: Sorted list of Year-Month labels and a list of headache counts aligned with the labels.
     """
     # Initialize a dictionary to count headaches per (year, month)
     month_counts = defaultdict(int)
@@ -83,6 +104,17 @@ def plot_monthly_headache_trends(aggregated_data):
     counts = [month_counts[year_month] for year_month in sorted_year_months]
     labels = [f"{year}-{month:02d}" for year, month in sorted_year_months]
 
+    return labels, counts
+
+
+def plot_headache_counts(labels, counts):
+    """
+    Plots precomputed monthly headache counts.
+
+    Args:
+        labels (list of str): Year-Month labels returned by `count_monthly_headaches`.
+        counts (list of int): Headache counts aligned with the labels.
+    """
     # Plot the data
     plt.figure(figsize=(12, 6))
     plt.plot(labels, counts, marker='o', linestyle='-', color='b')
@@ -95,12 +127,26 @@ def plot_monthly_headache_trends(aggregated_data):
     plt.show()
 
 
-def plot_medication_usage(aggregated_data):
+def plot_monthly_headache_trends(aggregated_data):
     """
-    Plots the usage trends of medications over time based on the aggregated data.
+    Plots the number of headaches per month based on the aggregated data.
+
+    Args:
+        aggregated_data (list of tuples): Aggregated headache data including observation date and pain description.
+    """
+    plot_headache_counts(*count_monthly_headaches(aggregated_data))
+
+
+def aggregate_medication_usage(aggregated_data):
+    """
+    Sums medication usage per month based on the aggregated data.
 
     Args:
         aggregated_data (list of tuples): Aggregated headache data including observation date and medications.
+
+    Returns:
+        tuple: Sorted list of Year-Month labels and a dictionary mapping each medication (plus the total)
+        to a list of monthly values aligned with the labels.
     """
     # Dictionary to store medication usage per (year-month)
     medication_usage = defaultdict(lambda: defaultdict(float))
@@ -132,6 +178,17 @@ def plot_medication_usage(aggregated_data):
             medication_trends[med].append(medication_usage[date].get(med, 0))  # Fill missing with 0
         medication_trends["Общее кол-во"].append(sum(medication_usage[date].values()))
 
+    return sorted_time_labels, medication_trends
+
+
+def plot_medication_trends(sorted_time_labels, medication_trends):
+    """
+    Plots precomputed monthly medication usage trends.
+
+    Args:
+        sorted_time_labels (list of str): Year-Month labels returned by `aggregate_medication_usage`.
+        medication_trends (dict): Medication name mapped to monthly values aligned with the labels.
+    """
     # Plot the medication usage trends
     plt.figure(figsize=(12, 6))
 
@@ -148,12 +205,11 @@ def plot_medication_usage(aggregated_data):
     plt.show()
 
 
-folder_path = "D:\\GoogleDisk\\Health\\Ruslan\\Мигрень"  # Folder containing yearly XLSX files
-xlsx_files = [os.path.join(folder_path, f) for f in os.listdir(folder_path) if f.endswith(".xlsx")]
-
-result = read_headache_data(xlsx_files)
-# for r in result:
-#     print(r)
+def plot_medication_usage(aggregated_data):
+    """
+    Plots the usage trends of medications over time based on the aggregated data.
 
-plot_monthly_headache_trends(result)
-plot_medication_usage(result)
+    Args:
+        aggregated_data (list of tuples): Aggregated headache data including observation date and medications.
+    """
+    plot_medication_trends(*aggregate_medication_usage(aggregated_data))
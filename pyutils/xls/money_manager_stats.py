@@ -0,0 +1,237 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.dates import DateFormatter
+import os
+
+from ..profiling import span
+
+INCOME_PREFIX = 'Incomes '
+EXPENSE_PREFIX = 'Expenses '
+SCENARIO_KEYS = ('exclude_income_cols', 'exclude_expense_cols', 'include_income_cols', 'include_expense_cols')
+
+
+def load_financial_data(file_path: str) -> pd.DataFrame:
+    """
+    Reads all sheets of a money manager Excel export into a single typed frame.
+
+    The file is parsed once; the result can be passed to `aggregate_financial_scenarios`
+    any number of times with different category exclusions.
+
+    Args:
+        file_path (str): Path to the Excel file.
+
+    Returns:
+        pd.DataFrame: Rows indexed by 'Date' with float 'Income', 'Expense' and 'Savings' totals,
+        followed by one float column per category named 'Incomes <category>' / 'Expenses <category>'.
+        Categories missing from a sheet are filled with 0.
+    """
+    if not os.path.isfile(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    # Read the Excel file (all sheets) in one pass
+    with span('money.read_excel', file=file_path):
+        sheets = pd.read_excel(file_path, sheet_name=None, header=[0, 1])
+    all_data = []
+
+    for df in sheets.values():
+        df = df.iloc[1:]  # Drop header and 'Previous savings' rows
+
+        # Flatten the multi-level columns
+        df.columns = [' '.join(str(s).strip() for s in col if str(s) != 'nan') for col in df.columns]
+
+        # Identify columns
+        date_col = [col for col in df.columns if 'Date' in col][0]
+        income_sum_col = [col for col in df.columns if 'Incomes sum' in col][0]
+        expense_sum_col = [col for col in df.columns if 'Expenses sum' in col][0]
+        savings_col = [col for col in df.columns if 'Savings' in col][0]
+        category_cols = [
+            col for col in df.columns
+            if col.startswith((INCOME_PREFIX, EXPENSE_PREFIX)) and col not in (income_sum_col, expense_sum_col)
+        ]
+
+        # Convert to typed columns
+        data = df[category_cols].apply(pd.to_numeric, errors='coerce').astype('float64')
+        data.insert(0, 'Date', pd.to_datetime(df[date_col], errors='coerce'))
+        data.insert(1, 'Income', pd.to_numeric(df[income_sum_col], errors='coerce').astype('float64'))
+        data.insert(2, 'Expense', pd.to_numeric(df[expense_sum_col], errors='coerce').astype('float64'))
+        data.insert(3, 'Savings', pd.to_numeric(df[savings_col], errors='coerce').astype('float64'))
+
+        all_data.append(data.dropna(subset=['Date']))
+
+    full_data = pd.concat(all_data, ignore_index=True)
+    category_cols = [col for col in full_data.columns if col.startswith((INCOME_PREFIX, EXPENSE_PREFIX))]
+    full_data[category_cols] = full_data[category_cols].fillna(0)
+    full_data.set_index('Date', inplace=True)
+
+    return full_data
+
+
+def _category_mask(categories: list[str], exclude: Optional[list[str]], include: Optional[list[str]]) -> np.ndarray:
+    """
+    Builds a 0/1 vector marking which of `categories` are subtracted from the total.
+
+    If `include` is given, every category not listed in it is excluded as well.
+    """
+    excluded = set(exclude or [])
+    if include is not None:
+        included = set(include)
+        excluded.update(c for c in categories if c not in included)
+    return np.array([c in excluded for c in categories], dtype='float64')
+
+
+def aggregate_financial_scenarios(
+        data: pd.DataFrame,
+        scenarios: dict[str, dict[str, list[str]]]
+) -> dict[str, pd.DataFrame]:
+    """
+    Aggregates loaded financial data by month for many category scenarios at once.
+
+    Category amounts are summed by month once, then all scenarios are computed with a single
+    matrix product of the monthly category totals and the scenario category masks.
+
+    Args:
+        data (pd.DataFrame): Frame returned by `load_financial_data`.
+        scenarios (dict): Scenario name mapped to a dict with any of the keys
+            'exclude_income_cols', 'exclude_expense_cols' (categories to subtract from the totals) and
+            'include_income_cols', 'include_expense_cols' (keep only these categories, subtract the rest).
+            An empty dict means no exclusions.
+
+    Returns:
+        dict[str, pd.DataFrame]: Scenario name mapped to monthly aggregated data with 'Income', 'Expense',
+        and 'Savings' columns indexed by month.
+
+    Raises:
+        ValueError: If a scenario uses a key other than the four above.
+    """
+    for name, scenario in scenarios.items():
+        unknown = sorted(set(scenario) - set(SCENARIO_KEYS))
+        if unknown:
+            raise ValueError(f"Unknown keys in scenario '{name}': {', '.join(unknown)}. "
+                             f"Supported keys: {', '.join(SCENARIO_KEYS)}")
+
+    names = list(scenarios)
+    monthly_data = data[['Income', 'Expense', 'Savings']].resample('ME').agg({
+        'Income': 'sum',
+        'Expense': 'sum',
+        'Savings': 'last'  # Already aggregated in the source
+    })
+
+    excluded = {}
+    for total_col, prefix, kind in (('Income', INCOME_PREFIX, 'income'), ('Expense', EXPENSE_PREFIX, 'expense')):
+        category_cols = [col for col in data.columns if col.startswith(prefix)]
+        categories = [col[len(prefix):] for col in category_cols]
+
+        # Rows without a total are skipped by the monthly sum, so their categories must not be subtracted either
+        amounts = data[category_cols].where(data[total_col].notna(), 0).resample('ME').sum()
+        amounts = amounts.reindex(monthly_data.index, fill_value=0)
+
+        # (categories x scenarios) mask, then (months x categories) @ (categories x scenarios)
+        mask = np.column_stack([
+            _category_mask(
+                categories,
+                scenarios[name].get(f'exclude_{kind}_cols'),
+                scenarios[name].get(f'include_{kind}_cols')
+            )
+            for name in names
+        ]) if names else np.zeros((len(categories), 0))
+        excluded[total_col] = amounts.to_numpy() @ mask
+
+    results = {}
+    for i, name in enumerate(names):
+        result = monthly_data.copy()
+        result['Income'] -= excluded['Income'][:, i]
+        result['Expense'] -= excluded['Expense'][:, i]
+        results[name] = result
+
+    return results
+
+
+def aggregate_financial_data(
+        file_path: str,
+        exclude_income_cols: Optional[list[str]] = None,
+        exclude_expense_cols: Optional[list[str]] = None
+) -> pd.DataFrame:
+    """
+    Reads and aggregates financial data from an Excel file.
+
+    To compare several exclusion scenarios, call `load_financial_data` once and pass the result
+    to `aggregate_financial_scenarios` instead of calling this function repeatedly.
+
+    Args:
+        file_path (str): Path to the Excel file.
+        exclude_income_cols (List[str], optional): Income category columns to exclude.
+        exclude_expense_cols (List[str], optional): Expense category columns to exclude.
+
+    Returns:
+        pd.DataFrame: Monthly aggregated financial data with 'Income', 'Expense', and 'Savings' columns indexed by month.
+    """
+    data = load_financial_data(file_path)
+    scenario = {
+        'exclude_income_cols': exclude_income_cols or [],
+        'exclude_expense_cols': exclude_expense_cols or []
+    }
+    return aggregate_financial_scenarios(data, {'default': scenario})['default']
+
+
+def plot_financial_summary(monthly_data: pd.DataFrame) -> None:
+    """
+    Plots a financial summary from aggregated monthly data (assumed to be in currency units, e.g., RUB or USD).
+
+    Interprets all values as being in millions.
+    
+    Args:
+        monthly_data (pd.DataFrame): A DataFrame indexed by month with 'Income', 'Expense', and 'Savings' columns.
+    """
+    fig, ax1 = plt.subplots(figsize=(12, 6))
+
+    ax1.plot(monthly_data.index, monthly_data['Income'], color='green', label='Monthly Income')
+    ax1.plot(monthly_data.index, monthly_data['Expense'], color='red', label='Monthly Expense')
+
+    ax2 = ax1.twinx()
+    ax2.bar(monthly_data.index, monthly_data['Savings'], width=20, alpha=0.5, color='blue', label='Monthly Savings')
+
+    ax1.set_xlabel('Time line')
+    ax1.set_ylabel('Income / Expense')
+    ax2.set_ylabel('Savings')
+    ax1.xaxis.set_major_formatter(DateFormatter('%Y-%m'))
+    fig.autofmt_xdate()
+
+    lines_1, labels_1 = ax1.get_legend_handles_labels()
+    lines_2, labels_2 = ax2.get_legend_handles_labels()
+    ax1.legend(lines_1 + lines_2, labels_1 + labels_2, loc='upper left')
+
+    plt.title('Monthly Financial Overview')
+    plt.tight_layout()
+    plt.grid(True)
+    plt.show()
+
+
+# Load once, then compare several scenarios without re-reading the file
+# data = load_financial_data("D:\\GoogleDisk\\Money-management\\xls-backups\\2025_05_08\\Главный_RUB_20250508_183425.xlsx")
+# scenarios = aggregate_financial_scenarios(data, {
+#     # All
+#     "All": {},
+#     # Investment excluded
+#     "Investment excluded": {
+#         "exclude_income_cols": ["Инвестиции"],
+#         "exclude_expense_cols": ["Инвестиции"]
+#     },
+#     # Only Investment
+#     "Only Investment": {
+#         "include_income_cols": ["Инвестиции"],
+#         "include_expense_cols": ["Инвестиции"]
+#     }
+# })
+# for name, monthly_data in scenarios.items():
+#     plot_financial_summary(monthly_data)
+
+# Single scenario
+# data = aggregate_financial_data(
+#     "D:\\GoogleDisk\\Money-management\\xls-backups\\2025_04_12\\Главный_RUB_20250412_131419.xlsx",
+#     exclude_income_cols=["Инвестиции"],
+#     exclude_expense_cols=["Инвестиции"]
+# )
+# plot_financial_summary(data)